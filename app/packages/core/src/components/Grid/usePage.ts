@@ -13,6 +13,7 @@ const usePage = (
 ): [MutableRefObject<number>, Get<number>] => {
   const handleError = useErrorHandler();
   const next = useRef(0);
+  const cursors = useRef<{ [page: number]: string }>({});
   return [
     next,
     useRecoilCallback(
@@ -23,15 +24,24 @@ const usePage = (
               pageParameters(modal)
             );
 
-            const { results, more } = await getFetchFunction()(
+            if (page === 1) {
+              cursors.current = {};
+            }
+
+            const { results, more, cursor } = await getFetchFunction()(
               "POST",
               "/samples",
               {
                 ...params,
                 page,
+                after: cursors.current[page],
               }
             );
 
+            if (cursor) {
+              cursors.current[page + 1] = cursor;
+            }
+
             const itemData: SampleData[] = results.map((result) => {
               const data: SampleData = {
                 sample: result.sample,
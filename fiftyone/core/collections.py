@@ -2901,6 +2901,7 @@ class SampleCollection(object):
         use_boxes=False,
         classwise=True,
         dynamic=True,
+        num_workers=None,
         **kwargs,
     ):
         """Evaluates the specified predicted detections in this collection with
@@ -2987,6 +2988,13 @@ class SampleCollection(object):
                 label (True) or allow matches between classes (False)
             dynamic (True): whether to declare the dynamic object-level
                 attributes that are populated on the dataset's schema
+            num_workers (None): an optional number of processes to use to
+                perform the evaluation. If a value greater than 1 is provided,
+                the collection is split into batches of samples by ID that are
+                evaluated in a process pool, and the results are written to
+                the database via bulk updates. Only applicable when evaluating
+                sample-level fields of non-generated collections. By default,
+                evaluation is performed in the main process
             **kwargs: optional keyword arguments for the constructor of the
                 :class:`fiftyone.utils.eval.detection.DetectionEvaluationConfig`
                 being used
@@ -3007,6 +3015,7 @@ class SampleCollection(object):
             use_boxes=use_boxes,
             classwise=classwise,
             dynamic=dynamic,
+            num_workers=num_workers,
             **kwargs,
         )
 
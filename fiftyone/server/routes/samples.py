@@ -26,12 +26,18 @@ class Samples(HTTPEndpoint):
         slice = data.get("slice", None)
         extended = data.get("extended", None)
 
+        # Clients that provide the cursor returned with the previous page are
+        # keyset paginated rather than skipping the samples of earlier pages
+        after = data.get("after", None)
+        if after is None:
+            after = (page - 1) * page_length - 1
+
         results = await paginate_samples(
             dataset,
             stages,
             filters,
             page_length,
-            (page - 1) * page_length - 1,
+            after,
             sample_filter=SampleFilter(group=GroupElementFilter(slice=slice)),
             extended_stages=extended,
         )
@@ -39,4 +45,5 @@ class Samples(HTTPEndpoint):
         return {
             "results": [asdict(edge.node) for edge in results.edges],
             "more": results.page_info.has_next_page,
+            "cursor": results.edges[-1].cursor if results.edges else None,
         }
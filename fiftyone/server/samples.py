@@ -6,14 +6,22 @@ FiftyOne Server samples pagination
 |
 """
 import asyncio
+import base64
+from copy import copy
+from datetime import datetime
+import numbers
+
+from bson import json_util, ObjectId
 import strawberry as gql
 import typing as t
 
+import eta.core.utils as etau
 
 from fiftyone.core.collections import SampleCollection
 from fiftyone.core.expressions import ViewField as F
 import fiftyone.core.media as fom
 import fiftyone.core.odm as foo
+import fiftyone.core.stages as fosg
 from fiftyone.server.filters import SampleFilter
 
 import fiftyone.server.metadata as fosm
@@ -62,6 +70,60 @@ MEDIA_TYPES = {
     fom.VIDEO: VideoSample,
 }
 
+# Hidden field in which the sort key of each sample is returned when keyset
+# pagination is used
+_KEYSET_FIELD = "_keyset_value"
+_MISSING = object()
+
+# Stages that neither reorder samples nor depend on their position
+_ORDER_PRESERVING_STAGES = (
+    fosg.Exclude,
+    fosg.ExcludeBy,
+    fosg.ExcludeFields,
+    fosg.ExcludeFrames,
+    fosg.ExcludeGroups,
+    fosg.ExcludeLabels,
+    fosg.Exists,
+    fosg.FilterField,
+    fosg.FilterKeypoints,
+    fosg.FilterLabels,
+    fosg.GeoWithin,
+    fosg.LimitLabels,
+    fosg.MapLabels,
+    fosg.Match,
+    fosg.MatchFrames,
+    fosg.MatchLabels,
+    fosg.MatchTags,
+    fosg.SelectFields,
+    fosg.SelectFrames,
+    fosg.SelectLabels,
+    fosg.SetField,
+)
+_ORDERED_SELECT_STAGES = (fosg.Select, fosg.SelectBy, fosg.SelectGroups)
+_ORDER_PRESERVING_MONGO_OPERATORS = {
+    "$addFields",
+    "$match",
+    "$project",
+    "$set",
+    "$unset",
+}
+
+# Order in which MongoDB sorts values of different BSON types, for the types
+# that keyset cursors support. Arrays are omitted since they are sorted by
+# their elements
+_BSON_TYPE_ORDER = [
+    ["null"],
+    ["double", "int", "long", "decimal"],
+    ["string", "symbol"],
+    ["object"],
+    ["binData"],
+    ["objectId"],
+    ["bool"],
+    ["date"],
+    ["timestamp"],
+    ["regex"],
+]
+
 
 async def paginate_samples(
     dataset: str,
@@ -96,11 +158,16 @@ async def paginate_samples(
     # full datasets.
     full_lookup = media == fom.VIDEO and (filters or stages)
     support = [1, 1] if not full_lookup else None
-    if after is None:
-        after = "-1"
 
-    if int(after) > -1:
-        view = view.skip(int(after) + 1)
+    offset, key, value, _id = _parse_cursor(after)
+
+    keyset = _get_keyset(view)
+    if keyset is not None and (_id is None or key == keyset[1]):
+        view = _make_keyset_view(view, *keyset, value=value, _id=_id)
+    else:
+        keyset = None
+        if offset > -1:
+            view = view.skip(offset + 1)
 
     pipeline = view._pipeline(
         attach_frames=True,
@@ -124,6 +191,16 @@ async def paginate_samples(
         samples = samples[:first]
         more = True
 
+    cursors = []
+    for idx, sample in enumerate(samples, offset + 1):
+        value = sample.pop(_KEYSET_FIELD, _MISSING)
+        if keyset is not None and _get_bson_type_idx(value) is not None:
+            cursor = _make_cursor(idx, keyset[1], value, sample["_id"])
+        else:
+            cursor = _make_cursor(idx)
+
+        cursors.append(cursor)
+
     metadata_cache = {}
     url_cache = {}
     nodes = await asyncio.gather(
@@ -134,13 +211,8 @@ async def paginate_samples(
     )
 
     edges = []
-    for idx, node in enumerate(nodes):
-        edges.append(
-            Edge(
-                node=node,
-                cursor=str(idx + int(after) + 1),
-            )
-        )
+    for node, cursor in zip(nodes, cursors):
+        edges.append(Edge(node=node, cursor=cursor))
 
     return Connection(
         page_info=PageInfo(
@@ -175,3 +247,172 @@ async def _create_sample_item(
     )
 
     return from_dict(cls, {"id": sample["_id"], "sample": sample, **metadata})
+
+
+def _make_cursor(offset, key=None, value=None, _id=None):
+    if _id is None:
+        return str(offset)
+
+    d = {"offset": offset, "key": key, "value": value, "id": _id}
+    return base64.urlsafe_b64encode(json_util.dumps(d).encode()).decode()
+
+
+def _parse_cursor(cursor):
+    """Parses a cursor generated by :func:`_make_cursor`.
+
+    Cursors are either sample offsets, which are also accepted as integers, or
+    encoded keyset positions that store the offset, sort key and ``_id`` of
+    the last sample that was returned.
+
+    Returns:
+        a tuple of
+
+        -   the offset of the sample, or -1 if no cursor was provided
+        -   the sort key, or None
+        -   the sort value, or None
+        -   the ``ObjectId`` of the sample, or None
+    """
+    if cursor is None:
+        return -1, None, None, None
+
+    try:
+        return int(cursor), None, None, None
+    except ValueError:
+        pass
+
+    d = json_util.loads(base64.urlsafe_b64decode(cursor.encode()))
+    return d["offset"], d["key"], d["value"], d["id"]
+
+
+def _get_keyset(view):
+    """Determines how the given view can be keyset paginated.
+
+    Views whose stages neither reorder samples nor depend on their position
+    are paginated by ``_id``. Views whose order is defined by a
+    :class:`fiftyone.core.stages.SortBy` stage on a sample field are paginated
+    by that field, with ``_id`` as a tiebreaker.
+
+    Returns:
+        a ``(stage_idx, key, order)`` tuple, where ``stage_idx`` is the index
+        of the sort stage, or None if the view is unsorted. Returns None if
+        the view cannot be keyset paginated
+    """
+    stages = view._stages
+    for idx in range(len(stages) - 1, -1, -1):
+        stage = stages[idx]
+        if _is_order_preserving(stage):
+            continue
+
+        if not isinstance(stage, fosg.SortBy):
+            return None
+
+        path = stage._get_mongo_field_or_expr()
+        if not etau.is_str(path) or path == _KEYSET_FIELD:
+            return None
+
+        if view._is_frame_field(path) or (
+            view._dataset.media_type == fom.GROUP
+            and view._get_group_slices(path)
+        ):
+            return None
+
+        return idx, path, -1 if stage._reverse else 1
+
+    return None, "_id", 1
+
+
+def _is_order_preserving(stage):
+    if isinstance(stage, _ORDERED_SELECT_STAGES):
+        return not stage.ordered
+
+    if isinstance(stage, fosg.Mongo):
+        return all(
+            set(d.keys()).issubset(_ORDER_PRESERVING_MONGO_OPERATORS)
+            for d in stage.pipeline
+        )
+
+    return isinstance(stage, _ORDER_PRESERVING_STAGES)
+
+
+def _make_keyset_view(view, stage_idx, key, order, value=None, _id=None):
+    pipeline = []
+
+    if _id is not None:
+        if key == "_id":
+            match = {"_id": {"$gt": _id}}
+        else:
+            match = _make_keyset_match(key, order, value, _id)
+
+        pipeline.append({"$match": match})
+
+    if key == "_id":
+        pipeline.append({"$sort": {"_id": 1}})
+    else:
+        pipeline.append({"$sort": {key: order, "_id": 1}})
+
+    pipeline.append({"$set": {_KEYSET_FIELD: {"$ifNull": ["$" + key, None]}}})
+
+    stage = fosg.Mongo(pipeline)
+
+    view = copy(view)
+    if stage_idx is None:
+        view._stages.insert(0, stage)
+    else:
+        view._stages[stage_idx] = stage
+
+    return view
+
+
+def _make_keyset_match(key, order, value, _id):
+    # Comparison query operators only match values of the same BSON type, so
+    # values of types that sort after (ascending) or before (descending) the
+    # cursor's type must be matched separately
+    type_idx = _get_bson_type_idx(value)
+
+    if order == 1:
+        types = _BSON_TYPE_ORDER[type_idx + 1 :]
+        op = "$gt"
+    else:
+        types = _BSON_TYPE_ORDER[1:type_idx]
+        op = "$lt"
+
+    clauses = [{key: value, "_id": {"$gt": _id}}]
+
+    if value is not None:
+        clauses.append({key: {op: value}})
+
+    if types:
+        clauses.append({key: {"$type": [t for _t in types for t in _t]}})
+
+    if order != 1 and value is not None:
+        clauses.append({key: None})
+
+    return {"$or": clauses}
+
+
+def _get_bson_type_idx(value):
+    if value is None:
+        return 0
+
+    if isinstance(value, bool):
+        return 6
+
+    if isinstance(value, numbers.Number):
+        return 1
+
+    if etau.is_str(value):
+        return 2
+
+    if isinstance(value, dict):
+        return 3
+
+    if isinstance(value, bytes):
+        return 4
+
+    if isinstance(value, ObjectId):
+        return 5
+
+    if isinstance(value, datetime):
+        return 7
+
+    return None
@@ -5,6 +5,7 @@ COCO-style detection evaluation.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import array
 import logging
 from collections import defaultdict
 
@@ -54,6 +55,11 @@ class COCOEvaluationConfig(DetectionEvaluationConfig):
         max_preds (None): the maximum number of predicted objects to evaluate
             when computing mAP and PR curves. Only applicable when
             ``compute_mAP`` is True
+        single_pass (True): whether to perform the IoU sweep required to
+            compute mAP and PR curves during the main evaluation pass, reusing
+            each image's IoUs for all thresholds (True), or in a separate pass
+            over the collection after evaluation (False). Only applicable when
+            ``compute_mAP`` is True
         error_level (1): the error level to use when manipulating instance
             masks or polylines. Valid values are:
 
@@ -78,6 +84,7 @@ class COCOEvaluationConfig(DetectionEvaluationConfig):
         compute_mAP=False,
         iou_threshs=None,
         max_preds=None,
+        single_pass=True,
         error_level=1,
         **kwargs,
     ):
@@ -98,6 +105,7 @@ class COCOEvaluationConfig(DetectionEvaluationConfig):
         self.compute_mAP = compute_mAP
         self.iou_threshs = iou_threshs
         self.max_preds = max_preds
+        self.single_pass = single_pass
         self.error_level = error_level
 
     @property
@@ -127,6 +135,16 @@ class COCOEvaluation(DetectionEvaluation):
                 "evaluation"
             )
 
+        self._sweep = None
+
+    def register_samples(self, samples, eval_key, dynamic=True):
+        super().register_samples(samples, eval_key, dynamic=dynamic)
+
+        if self.config.compute_mAP and self.config.single_pass:
+            self._sweep = _IoUSweep(self.config)
+        else:
+            self._sweep = None
+
     def evaluate(self, sample_or_frame, eval_key=None):
         """Performs COCO-style evaluation on the given image.
 
@@ -161,18 +179,23 @@ class COCOEvaluation(DetectionEvaluation):
             gts = _copy_labels(gts)
             preds = _copy_labels(preds)
 
-        return _coco_evaluation_single_iou(gts, preds, eval_key, self.config)
+        return _coco_evaluation_single_iou(
+            gts, preds, eval_key, self.config, sweep=self._sweep
+        )
 
     def generate_results(
         self, samples, matches, eval_key=None, classes=None, missing=None
     ):
         """Generates aggregate evaluation results for the samples.
 
-        If ``self.config.compute_mAP`` is True, this method performs COCO-style
-        evaluation as in :meth:`evaluate` to generate precision and recall
-        sweeps over the range of IoU thresholds in ``self.config.iou_threshs``.
-        In this case, a :class:`COCODetectionResults` instance is returned that
-        can compute mAP and PR curves.
+        If ``self.config.compute_mAP`` is True, this method generates precision
+        and recall sweeps over the range of IoU thresholds in
+        ``self.config.iou_threshs``. If ``self.config.single_pass`` is True,
+        the sweeps are generated from the data that :meth:`evaluate` gathered
+        during the main evaluation pass; otherwise, COCO-style evaluation is
+        performed in a separate pass over the samples. In either case, a
+        :class:`COCODetectionResults` instance is returned that can compute mAP
+        and PR curves.
 
         Args:
             samples: a :class:`fiftyone.core.collections.SampleCollection`
@@ -205,13 +228,18 @@ class COCOEvaluation(DetectionEvaluation):
                 samples=samples,
             )
 
+        if self._sweep is not None:
+            sweep = self._sweep
+        else:
+            sweep = _perform_iou_sweep(samples, config)
+
         (
             precision,
             recall,
             thresholds,
             iou_threshs,
             classes,
-        ) = _compute_pr_curves(samples, config, classes=classes)
+        ) = _compute_pr_curves(sweep, config, classes=classes)
 
         return COCODetectionResults(
             matches,
@@ -227,6 +255,13 @@ class COCOEvaluation(DetectionEvaluation):
             samples=samples,
         )
 
+    def _get_partial_results(self):
+        return self._sweep
+
+    def _merge_partial_results(self, partial_results):
+        if self._sweep is not None and partial_results is not None:
+            self._sweep.merge(partial_results)
+
 
 class COCODetectionResults(DetectionResults):
     """Class that stores the results of a COCO detection evaluation.
@@ -419,7 +454,7 @@ _NO_MATCH_ID = ""
 _NO_MATCH_IOU = None
 
 
-def _coco_evaluation_single_iou(gts, preds, eval_key, config):
+def _coco_evaluation_single_iou(gts, preds, eval_key, config, sweep=None):
     iou_thresh = min(config.iou, 1 - 1e-10)
     id_key = "%s_id" % eval_key
     iou_key = "%s_iou" % eval_key
@@ -428,6 +463,10 @@ def _coco_evaluation_single_iou(gts, preds, eval_key, config):
         gts, preds, [id_key], iou_key, config
     )
 
+    if sweep is not None:
+        # Reuse this image's IoUs to match objects at all sweep thresholds
+        sweep.add(cats, iscrowd)
+
     matches = _compute_matches(
         cats,
         pred_ious,
@@ -442,29 +481,6 @@ def _coco_evaluation_single_iou(gts, preds, eval_key, config):
     return [m[:-1] for m in matches]
 
 
-def _coco_evaluation_iou_sweep(gts, preds, config):
-    iou_threshs = config.iou_threshs
-    id_keys = ["eval_id_%s" % str(i).replace(".", "_") for i in iou_threshs]
-    iou_key = "eval_iou"
-
-    cats, pred_ious, iscrowd = _coco_evaluation_setup(
-        gts, preds, id_keys, iou_key, config, max_preds=config.max_preds
-    )
-
-    return [
-        _compute_matches(
-            cats,
-            pred_ious,
-            iou_thresh,
-            iscrowd,
-            eval_key="_eval",
-            id_key=id_key,
-            iou_key=iou_key,
-        )
-        for iou_thresh, id_key in zip(iou_threshs, id_keys)
-    ]
-
-
 def _coco_evaluation_setup(
     gts, preds, id_keys, iou_key, config, max_preds=None
 ):
@@ -521,6 +537,8 @@ def _coco_evaluation_setup(
         # Compute ``num_preds x num_gts`` IoUs
         ious = foui.compute_ious(preds, gts, **iou_kwargs)
 
+        objects["ious"] = (gts, ious)
+
         gt_ids = [g.id for g in gts]
         for pred, gt_ious in zip(preds, ious):
             pred_ious[pred.id] = list(zip(gt_ids, gt_ious))
@@ -635,21 +653,164 @@ def _compute_matches(
     return matches
 
 
-def _compute_pr_curves(samples, config, classes=None):
+class _IoUSweep(object):
+    """Accumulates the per-class true positive/false positive confidences and
+    ground truth counts needed to compute PR curves over a range of IoU
+    thresholds.
+
+    Confidences are stored in compact typed buffers rather than as lists of
+    match tuples.
+
+    Args:
+        config: a :class:`COCOEvaluationConfig`
+    """
+
+    def __init__(self, config):
+        self.iou_threshs = list(config.iou_threshs)
+        self.max_preds = config.max_preds
+        self.classes = set()
+        self.data = [{} for _ in self.iou_threshs]
+
+    def add(self, cats, iscrowd):
+        """Adds the objects from an image to the sweep.
+
+        Args:
+            cats: the per-category objects and IoUs returned by
+                :func:`_coco_evaluation_setup`
+            iscrowd: a function that determines whether a ground truth object
+                is a crowd
+        """
+        for objects in cats.values():
+            gts, ious = objects["ious"]
+            preds = objects["preds"]
+
+            if self.max_preds is not None:
+                preds = preds[: self.max_preds]
+                ious = ious[: self.max_preds, :]
+
+            gt_labels = np.array([gt.label for gt in gts], dtype=object)
+            gt_crowds = np.array([iscrowd(gt) for gt in gts], dtype=bool)
+            pred_labels = [pred.label for pred in preds]
+            pred_confs = [pred.confidence for pred in preds]
+
+            for idx, iou_thresh in enumerate(self.iou_threshs):
+                self._add_matches(
+                    idx,
+                    iou_thresh,
+                    ious,
+                    gt_labels,
+                    gt_crowds,
+                    pred_labels,
+                    pred_confs,
+                )
+
+    def merge(self, sweep):
+        """Merges the contents of another sweep into this one.
+
+        Args:
+            sweep: an :class:`_IoUSweep`
+        """
+        self.classes.update(sweep.classes)
+
+        for data, other_data in zip(self.data, sweep.data):
+            for c, other in other_data.items():
+                d = self._get_class_data(data, c)
+                d["tp"].extend(other["tp"])
+                d["fp"].extend(other["fp"])
+                d["num_gt"] += other["num_gt"]
+
+    def _add_matches(
+        self,
+        idx,
+        iou_thresh,
+        ious,
+        gt_labels,
+        gt_crowds,
+        pred_labels,
+        pred_confs,
+    ):
+        # Replicates the greedy matching of `_compute_matches()`: predictions
+        # are matched in descending order of confidence to the available
+        # ground truth object with the highest IoU, where non-crowd objects
+        # take precedence over crowds and ties go to the last object
+        num_gts = len(gt_labels)
+        matched = np.zeros(num_gts, dtype=bool)
+        is_candidate = ious >= iou_thresh
+
+        for pred_ious, candidates, pred_label, confidence in zip(
+            ious, is_candidate, pred_labels, pred_confs
+        ):
+            candidates = candidates & ~(matched & ~gt_crowds)
+            candidates &= ~gt_crowds | (gt_labels == pred_label)
+
+            best = -1
+            for group in (~gt_crowds, gt_crowds):
+                inds = np.nonzero(candidates & group)[0]
+                if inds.size > 0:
+                    _ious = pred_ious[inds]
+                    best = inds[len(inds) - 1 - np.argmax(_ious[::-1])]
+                    break
+
+            if best >= 0:
+                matched[best] = True
+                self._add_match(
+                    idx,
+                    gt_labels[best],
+                    pred_label,
+                    confidence,
+                    gt_crowds[best],
+                )
+            else:
+                self._add_match(idx, None, pred_label, confidence, None)
+
+        for gt_label, gt_crowd in zip(
+            gt_labels[~matched], gt_crowds[~matched]
+        ):
+            self._add_match(idx, gt_label, None, None, gt_crowd)
+
+    def _add_match(self, idx, gt_label, pred_label, confidence, iscrowd):
+        self.classes.add(gt_label)
+        self.classes.add(pred_label)
+
+        if iscrowd:
+            return
+
+        c = gt_label if gt_label is not None else pred_label
+        d = self._get_class_data(self.data[idx], c)
+
+        if confidence is None:
+            confidence = np.nan
+
+        if gt_label == pred_label:
+            d["tp"].append(confidence)
+        elif pred_label:
+            d["fp"].append(confidence)
+
+        if gt_label:
+            d["num_gt"] += 1
+
+    @staticmethod
+    def _get_class_data(data, c):
+        if c not in data:
+            data[c] = {
+                "tp": array.array("d"),
+                "fp": array.array("d"),
+                "num_gt": 0,
+            }
+
+        return data[c]
+
+
+def _perform_iou_sweep(samples, config):
     gt_field = config.gt_field
     pred_field = config.pred_field
-    iou_threshs = config.iou_threshs
 
     samples = samples.select_fields([gt_field, pred_field])
 
     gt_field, processing_frames = samples._handle_frame_field(gt_field)
     pred_field, _ = samples._handle_frame_field(pred_field)
 
-    num_threshs = len(iou_threshs)
-    thresh_matches = [{} for _ in range(num_threshs)]
-
-    if classes is None:
-        _classes = set()
+    sweep = _IoUSweep(config)
 
     logger.info("Performing IoU sweep...")
     for sample in samples.iter_samples(progress=True):
@@ -663,39 +824,20 @@ def _compute_pr_curves(samples, config, classes=None):
             gts = _copy_labels(image[gt_field])
             preds = _copy_labels(image[pred_field])
 
-            matches_list = _coco_evaluation_iou_sweep(gts, preds, config)
-
-            for idx, matches in enumerate(matches_list):
-                for match in matches:
-                    gt_label = match[0]
-                    pred_label = match[1]
-                    iscrowd = match[-1]
-
-                    if classes is None:
-                        _classes.add(gt_label)
-                        _classes.add(pred_label)
-
-                    if iscrowd:
-                        continue
-
-                    c = gt_label if gt_label is not None else pred_label
+            cats, _, iscrowd = _coco_evaluation_setup(
+                gts, preds, [], "eval_iou", config
+            )
+            sweep.add(cats, iscrowd)
 
-                    if c not in thresh_matches[idx]:
-                        thresh_matches[idx][c] = {
-                            "tp": [],
-                            "fp": [],
-                            "num_gt": 0,
-                        }
+    return sweep
 
-                    if gt_label == pred_label:
-                        thresh_matches[idx][c]["tp"].append(match)
-                    elif pred_label:
-                        thresh_matches[idx][c]["fp"].append(match)
 
-                    if gt_label:
-                        thresh_matches[idx][c]["num_gt"] += 1
+def _compute_pr_curves(sweep, config, classes=None):
+    iou_threshs = config.iou_threshs
+    num_threshs = len(iou_threshs)
 
     if classes is None:
+        _classes = set(sweep.classes)
         _classes.discard(None)
         classes = sorted(_classes)
 
@@ -707,19 +849,21 @@ def _compute_pr_curves(samples, config, classes=None):
     precision = -np.ones((num_threshs, num_classes, 101))
     thresholds = -np.ones((num_threshs, num_classes, 101))
     recall = np.linspace(0, 1, 101)
-    for idx, _thresh_matches in enumerate(thresh_matches):
-        for c, matches in _thresh_matches.items():
+    for idx, class_data in enumerate(sweep.data):
+        for c, d in class_data.items():
             c_idx = class_idx_map.get(c, None)
-            num_gt = matches["num_gt"]
+            num_gt = d["num_gt"]
 
             if c_idx is None or num_gt == 0:
                 continue
 
-            tp = matches["tp"]
-            fp = matches["fp"]
-            tp_fp = np.array([1] * len(tp) + [0] * len(fp))
-            confs = np.array([m[3] for m in tp] + [m[3] for m in fp])
-            if None in confs:
+            tp = np.frombuffer(d["tp"], dtype=float)
+            fp = np.frombuffer(d["fp"], dtype=float)
+            tp_fp = np.concatenate(
+                [np.ones(tp.size, dtype=int), np.zeros(fp.size, dtype=int)]
+            )
+            confs = np.concatenate([tp, fp])
+            if np.isnan(confs).any():
                 raise ValueError(
                     "All predicted objects must have their `confidence` "
                     "attribute populated in order to compute precision-recall "
@@ -7,16 +7,24 @@ Detection evaluation.
 """
 import itertools
 import logging
+import math
 
 import numpy as np
+from pymongo import UpdateOne
 
 import fiftyone.core.evaluation as foe
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
-import fiftyone.core.validation as fov
+import fiftyone.core.odm as foo
+import fiftyone.core.utils as fou
+import fiftyone.core.validation as fova
 
 from .base import BaseEvaluationResults
 
+fod = fou.lazy_import("fiftyone.core.dataset")
+fos = fou.lazy_import("fiftyone.core.sample")
+fov = fou.lazy_import("fiftyone.core.view")
+
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +42,7 @@ def evaluate_detections(
     use_boxes=False,
     classwise=True,
     dynamic=True,
+    num_workers=None,
     **kwargs,
 ):
     """Evaluates the predicted detections in the given samples with respect to
@@ -120,13 +129,20 @@ def evaluate_detections(
             label (True) or allow matches between classes (False)
         dynamic (True): whether to declare the dynamic object-level attributes
             that are populated on the dataset's schema
+        num_workers (None): an optional number of processes to use to perform
+            the evaluation. If a value greater than 1 is provided, the
+            collection is split into batches of samples by ID that are
+            evaluated in a process pool, and the results are written to the
+            database via bulk updates. Only applicable when evaluating
+            sample-level fields of non-generated collections. By default,
+            evaluation is performed in the main process
         **kwargs: optional keyword arguments for the constructor of the
             :class:`DetectionEvaluationConfig` being used
 
     Returns:
         a :class:`DetectionResults`
     """
-    fov.validate_collection_label_fields(
+    fova.validate_collection_label_fields(
         samples,
         (pred_field, gt_field),
         (fol.Detections, fol.Polylines, fol.TemporalDetections),
@@ -137,7 +153,7 @@ def evaluate_detections(
     is_temporal = issubclass(label_type, fol.TemporalDetections)
 
     if is_temporal:
-        fov.validate_video_collection(samples)
+        fova.validate_video_collection(samples)
     else:
         kwargs.update(dict(use_masks=use_masks, use_boxes=use_boxes))
 
@@ -159,45 +175,23 @@ def evaluate_detections(
 
     processing_frames = samples._is_frame_field(pred_field)
 
-    if eval_key is not None:
-        tp_field = "%s_tp" % eval_key
-        fp_field = "%s_fp" % eval_key
-        fn_field = "%s_fn" % eval_key
-
-    if config.requires_additional_fields:
-        _samples = samples
-    else:
-        _samples = samples.select_fields([gt_field, pred_field])
+    if num_workers is not None and num_workers > 1:
+        if processing_frames or samples._is_generated:
+            logger.warning(
+                "Parallel evaluation is not supported for frame-level fields "
+                "or generated collections; evaluating in the main process"
+            )
+            num_workers = None
 
-    matches = []
     logger.info("Evaluating detections...")
-    for sample in _samples.iter_samples(progress=True):
-        if processing_frames:
-            docs = sample.frames.values()
-        else:
-            docs = [sample]
-
-        sample_tp = 0
-        sample_fp = 0
-        sample_fn = 0
-        for doc in docs:
-            doc_matches = eval_method.evaluate(doc, eval_key=eval_key)
-            matches.extend(doc_matches)
-            tp, fp, fn = _tally_matches(doc_matches)
-            sample_tp += tp
-            sample_fp += fp
-            sample_fn += fn
-
-            if processing_frames and eval_key is not None:
-                doc[tp_field] = tp
-                doc[fp_field] = fp
-                doc[fn_field] = fn
-
-        if eval_key is not None:
-            sample[tp_field] = sample_tp
-            sample[fp_field] = sample_fp
-            sample[fn_field] = sample_fn
-            sample.save()
+    if num_workers is not None and num_workers > 1:
+        matches = _evaluate_detections_multi(
+            samples, eval_method, eval_key, num_workers
+        )
+    else:
+        matches = _evaluate_detections(
+            samples, eval_method, eval_key, processing_frames
+        )
 
     results = eval_method.generate_results(
         samples, matches, eval_key=eval_key, classes=classes, missing=missing
@@ -341,6 +335,14 @@ class DetectionEvaluation(foe.EvaluationMethod):
         """
         raise NotImplementedError("subclass must implement evaluate()")
 
+    def _get_partial_results(self):
+        # Returns any data that evaluate() accumulated on this instance that
+        # must be merged back into the main process after parallel evaluation
+        return None
+
+    def _merge_partial_results(self, partial_results):
+        pass
+
     def generate_results(
         self, samples, matches, eval_key=None, classes=None, missing=None
     ):
@@ -549,6 +551,235 @@ class DetectionResults(BaseEvaluationResults):
         )
 
 
+def _evaluate_detections(samples, eval_method, eval_key, processing_frames):
+    config = eval_method.config
+
+    if eval_key is not None:
+        tp_field = "%s_tp" % eval_key
+        fp_field = "%s_fp" % eval_key
+        fn_field = "%s_fn" % eval_key
+
+    if config.requires_additional_fields:
+        _samples = samples
+    else:
+        _samples = samples.select_fields([config.gt_field, config.pred_field])
+
+    matches = []
+    for sample in _samples.iter_samples(progress=True):
+        if processing_frames:
+            docs = sample.frames.values()
+        else:
+            docs = [sample]
+
+        sample_tp = 0
+        sample_fp = 0
+        sample_fn = 0
+        for doc in docs:
+            doc_matches = eval_method.evaluate(doc, eval_key=eval_key)
+            matches.extend(doc_matches)
+            tp, fp, fn = _tally_matches(doc_matches)
+            sample_tp += tp
+            sample_fp += fp
+            sample_fn += fn
+
+            if processing_frames and eval_key is not None:
+                doc[tp_field] = tp
+                doc[fp_field] = fp
+                doc[fn_field] = fn
+
+        if eval_key is not None:
+            sample[tp_field] = sample_tp
+            sample[fp_field] = sample_fp
+            sample[fn_field] = sample_fn
+            sample.save()
+
+    return matches
+
+
+def _evaluate_detections_multi(samples, eval_method, eval_key, num_workers):
+    ids = sorted(samples.values("_id"))
+
+    num_samples = len(ids)
+    if num_samples == 0:
+        return []
+
+    # Use several batches per worker so that work is balanced across processes
+    batch_size = int(math.ceil(num_samples / (4 * num_workers)))
+    batch_size = min(max(batch_size, 1), 10000)
+
+    if eval_method.config.requires_additional_fields:
+        fields = None
+    else:
+        fields = [eval_method.gt_field, eval_method.pred_field]
+
+    if isinstance(samples, fov.DatasetView):
+        stages = samples._serialize(include_uuids=False)
+        filtered_fields = samples._get_filtered_fields()
+    else:
+        stages = []
+        filtered_fields = None
+
+    dataset_name = samples._root_dataset.name
+    group_slice = samples.group_slice
+
+    inputs = []
+    for start in range(0, num_samples, batch_size):
+        batch_ids = ids[start : (start + batch_size)]
+        inputs.append(
+            (
+                dataset_name,
+                stages,
+                group_slice,
+                eval_method,
+                eval_key,
+                fields,
+                filtered_fields,
+                batch_ids[0],
+                batch_ids[-1],
+            )
+        )
+
+    matches = []
+    with fou.ProgressBar(total=num_samples) as pb:
+        with fou.get_multiprocessing_context().Pool(
+            processes=num_workers
+        ) as pool:
+            for num_batch, batch_matches, partial_results in pool.imap(
+                _do_evaluate_detections_batch, inputs
+            ):
+                matches.extend(batch_matches)
+                eval_method._merge_partial_results(partial_results)
+                pb.update(count=num_batch)
+
+    if eval_key is not None:
+        # In-memory samples must reflect the bulk updates made by the workers
+        dataset = samples._dataset
+        fos.Sample._reload_docs(dataset._sample_collection_name)
+
+    return matches
+
+
+def _do_evaluate_detections_batch(args):
+    (
+        dataset_name,
+        stages,
+        group_slice,
+        eval_method,
+        eval_key,
+        fields,
+        filtered_fields,
+        first_id,
+        last_id,
+    ) = args
+
+    dataset = fod.load_dataset(dataset_name)
+    if group_slice is not None:
+        dataset.group_slice = group_slice
+
+    samples = fov.DatasetView._build(dataset, stages)
+
+    pipeline = [{"$match": {"_id": {"$gte": first_id, "$lte": last_id}}}]
+    if fields is not None:
+        pipeline.append({"$project": {f: True for f in fields}})
+
+    if eval_key is not None:
+        tp_field = "%s_tp" % eval_key
+        fp_field = "%s_fp" % eval_key
+        fn_field = "%s_fn" % eval_key
+        eval_attrs = (eval_key, "%s_id" % eval_key, "%s_iou" % eval_key)
+        label_fields = (eval_method.gt_field, eval_method.pred_field)
+
+    schema = {}
+    matches = []
+    ops = []
+    num_samples = 0
+    for d in samples._aggregate(post_pipeline=pipeline):
+        num_samples += 1
+
+        doc = _RawDocument(d, samples, schema)
+        doc_matches = eval_method.evaluate(doc, eval_key=eval_key)
+        matches.extend(doc_matches)
+
+        if eval_key is None:
+            continue
+
+        tp, fp, fn = _tally_matches(doc_matches)
+        update = {tp_field: tp, fp_field: fp, fn_field: fn}
+
+        for field_name in label_fields:
+            labels = doc[field_name]
+            if labels is None:
+                continue
+
+            list_field = labels._LABEL_LIST_FIELD
+            list_path = field_name + "." + list_field
+
+            if filtered_fields is None or list_path not in filtered_fields:
+                update[field_name] = labels.to_mongo()
+                continue
+
+            # The list has been filtered, so update its elements by ID
+            for label in labels[list_field]:
+                label_update = {
+                    list_path + ".$[element]." + attr: label[attr]
+                    for attr in eval_attrs
+                    if label.has_field(attr)
+                }
+                ops.append(
+                    UpdateOne(
+                        {"_id": d["_id"]},
+                        {"$set": label_update},
+                        array_filters=[{"element._id": label._id}],
+                    )
+                )
+
+        ops.append(UpdateOne({"_id": d["_id"]}, {"$set": update}))
+
+    if ops:
+        foo.bulk_write(ops, dataset._sample_collection)
+
+    return num_samples, matches, eval_method._get_partial_results()
+
+
+class _RawDocument(object):
+    """A read-only view into a raw sample dict that lazily decodes its fields
+    into their :class:`fiftyone.core.fields.Field` types on first access.
+    """
+
+    def __init__(self, d, samples, schema):
+        self._d = d
+        self._samples = samples
+        self._schema = schema
+        self._values = {}
+
+    def __getitem__(self, path):
+        if path not in self._values:
+            self._values[path] = self._parse_value(path)
+
+        return self._values[path]
+
+    def _parse_value(self, path):
+        value = self._d
+        for key in path.split("."):
+            if not isinstance(value, dict):
+                value = None
+                break
+
+            value = value.get(key, None)
+
+        if value is None:
+            return None
+
+        if path not in self._schema:
+            self._schema[path] = self._samples.get_field(path)
+
+        field = self._schema[path]
+        if field is not None:
+            value = field.to_python(value)
+
+        return value
+
+
 def _parse_config(pred_field, gt_field, method, is_temporal, **kwargs):
     if method is None:
         if is_temporal:
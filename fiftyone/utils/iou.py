@@ -457,14 +457,76 @@ def _compute_bbox_ious(preds, gts, iscrowd=None, classwise=False):
             gts = _polylines_to_detections(gts)
 
     if _get_bbox_dim(gts[0]) == 3:
-        bbox_iou_fcn = _compute_cuboid_iou
+        return _compute_cuboid_ious(
+            preds, gts, gt_crowds, is_symmetric, classwise=classwise
+        )
+
+    pred_boxes = _to_bbox_array(preds)
+
+    if is_symmetric:
+        gt_boxes = pred_boxes
     else:
-        bbox_iou_fcn = _compute_bbox_iou
+        gt_boxes = _to_bbox_array(gts)
+
+    ious = _compute_bbox_iou_matrix(
+        pred_boxes, gt_boxes, gt_crowds=np.array(gt_crowds, dtype=bool)
+    )
+
+    if classwise:
+        pred_labels = np.array([pred.label for pred in preds], dtype=object)
+
+        if is_symmetric:
+            gt_labels = pred_labels
+        else:
+            gt_labels = np.array([gt.label for gt in gts], dtype=object)
+
+        ious[pred_labels[:, np.newaxis] != gt_labels[np.newaxis, :]] = 0
+
+    if is_symmetric:
+        # Only the lower triangle is computed; the upper triangle mirrors it
+        # and every object perfectly overlaps itself
+        ious = np.tril(ious, k=-1)
+        ious += ious.T
+        np.fill_diagonal(ious, 1)
+
+    return ious
 
+
+def _to_bbox_array(detections):
+    return np.array(
+        [detection.bounding_box for detection in detections], dtype=float
+    ).reshape(-1, 4)
+
+
+def _compute_bbox_iou_matrix(pred_boxes, gt_boxes, gt_crowds=None):
+    # pred_boxes: num_preds x 4, gt_boxes: num_gts x 4, in [x, y, w, h] format
+    px, py, pw, ph = (pred_boxes[:, k, np.newaxis] for k in range(4))
+    gx, gy, gw, gh = (gt_boxes[np.newaxis, :, k] for k in range(4))
+
+    pred_areas = ph * pw
+    gt_areas = gh * gw
+
+    # Dimensions of intersections
+    w = np.minimum(px + pw, gx + gw) - np.maximum(px, gx)
+    h = np.minimum(py + ph, gy + gh) - np.maximum(py, gy)
+    inter = np.maximum(w, 0) * np.maximum(h, 0)
+
+    union = pred_areas + gt_areas - inter
+
+    if gt_crowds is not None and gt_crowds.any():
+        union = np.where(gt_crowds[np.newaxis, :], pred_areas, union)
+
+    ious = np.divide(
+        inter, union, out=np.zeros_like(inter), where=(union != 0)
+    )
+
+    return np.minimum(ious, 1)
+
+
+def _compute_cuboid_ious(preds, gts, gt_crowds, is_symmetric, classwise=False):
     ious = np.zeros((len(preds), len(gts)))
 
     for j, (gt, gt_crowd) in enumerate(zip(gts, gt_crowds)):
-
         for i, pred in enumerate(preds):
             if is_symmetric and i < j:
                 iou = ious[j, i]
@@ -473,7 +535,7 @@ def _compute_bbox_ious(preds, gts, iscrowd=None, classwise=False):
             elif classwise and pred.label != gt.label:
                 continue
             else:
-                iou = bbox_iou_fcn(gt, pred, gt_crowd=gt_crowd)
+                iou = _compute_cuboid_iou(gt, pred, gt_crowd=gt_crowd)
 
             ious[i, j] = iou
 
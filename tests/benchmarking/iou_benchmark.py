@@ -0,0 +1,84 @@
+"""
+Benchmarking for :func:`fiftyone.utils.iou.compute_ious` on bounding boxes.
+
+Compares the vectorized IoU matrix computation against a reference
+implementation that calls ``_compute_bbox_iou()`` once per pair of objects.
+
+Results are written to `iou_benchmark.log`.
+
+| Copyright 2017-2023, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import logging
+import os
+import time
+
+import numpy as np
+
+import eta.core.logging as etal
+
+import fiftyone as fo
+import fiftyone.utils.iou as foui
+
+
+logger = logging.getLogger(__name__)
+
+
+# Logs everything written by a `logger` in this benchmark
+etal.custom_setup(
+    etal.LoggingConfig(
+        dict(
+            filename=os.path.splitext(os.path.abspath(__file__))[0] + ".log",
+            file_format="%(message)s",
+        )
+    ),
+    verbose=False,
+)
+
+
+def make_detections(num_objects):
+    boxes = np.random.rand(num_objects, 4) * [0.8, 0.8, 0.2, 0.2]
+    return [
+        fo.Detection(label="object", bounding_box=list(box)) for box in boxes
+    ]
+
+
+def compute_ious_loop(preds, gts):
+    ious = np.zeros((len(preds), len(gts)))
+    for j, gt in enumerate(gts):
+        for i, pred in enumerate(preds):
+            ious[i, j] = foui._compute_bbox_iou(gt, pred)
+
+    return ious
+
+
+def time_fcn(fcn, *args, num_iters=3):
+    start = time.time()
+    for _ in range(num_iters):
+        fcn(*args)
+
+    return (time.time() - start) / num_iters
+
+
+#
+# Bounding box IoU benchmark
+#
+
+logger.info("\nStarting test")
+for num_objects in [10, 50, 100, 300, 1000]:
+    preds = make_detections(num_objects)
+    gts = make_detections(num_objects)
+
+    loop_time = time_fcn(compute_ious_loop, preds, gts)
+    vectorized_time = time_fcn(foui.compute_ious, preds, gts)
+
+    logger.info(
+        "N = %d: loop %.4fs, vectorized %.4fs, speedup %.1fx"
+        % (
+            num_objects,
+            loop_time,
+            vectorized_time,
+            loop_time / max(vectorized_time, 1e-9),
+        )
+    )
@@ -16,6 +16,7 @@ import numpy as np
 import eta.core.utils as etau
 
 import fiftyone as fo
+from fiftyone import ViewField as F
 import fiftyone.utils.labels as foul
 import fiftyone.utils.iou as foui
 
@@ -1415,6 +1416,94 @@ class DetectionsTests(unittest.TestCase):
 
         self._evaluate_coco(dataset, kwargs)
 
+    @drop_datasets
+    def test_evaluate_detections_coco_single_pass(self):
+        dataset = self._make_detections_dataset()
+
+        results1 = dataset.evaluate_detections(
+            "predictions",
+            gt_field="ground_truth",
+            eval_key="eval1",
+            method="coco",
+            compute_mAP=True,
+            single_pass=True,
+        )
+        results2 = dataset.evaluate_detections(
+            "predictions",
+            gt_field="ground_truth",
+            eval_key="eval2",
+            method="coco",
+            compute_mAP=True,
+            single_pass=False,
+        )
+
+        self.assertListEqual(list(results1.classes), list(results2.classes))
+        self.assertTrue(np.array_equal(results1.precision, results2.precision))
+        self.assertTrue(
+            np.array_equal(results1.thresholds, results2.thresholds)
+        )
+        self.assertEqual(results1.mAP(), results2.mAP())
+
+    @drop_datasets
+    def test_evaluate_detections_multi(self):
+        dataset = self._make_detections_dataset()
+
+        for method in ("coco", "open-images"):
+            results1 = dataset.evaluate_detections(
+                "predictions",
+                gt_field="ground_truth",
+                eval_key="eval1",
+                method=method,
+            )
+            results2 = dataset.evaluate_detections(
+                "predictions",
+                gt_field="ground_truth",
+                eval_key="eval2",
+                method=method,
+                num_workers=2,
+            )
+
+            self.assertDictEqual(results1.metrics(), results2.metrics())
+
+            for field in ("ground_truth", "predictions"):
+                for suffix in ("", "_id", "_iou"):
+                    path = "%s.detections.eval%%d%s" % (field, suffix)
+                    self.assertListEqual(
+                        dataset.values(path % 1), dataset.values(path % 2)
+                    )
+
+            for suffix in ("_tp", "_fp", "_fn"):
+                self.assertListEqual(
+                    dataset.values("eval1" + suffix),
+                    dataset.values("eval2" + suffix),
+                )
+
+            dataset.delete_evaluations()
+
+        # Evaluating a view with filtered label lists must not delete labels
+        view = dataset.filter_labels("predictions", F("label") == "cat")
+        view.evaluate_detections(
+            "predictions",
+            gt_field="ground_truth",
+            eval_key="eval",
+            num_workers=2,
+        )
+
+        self.assertEqual(dataset.count("predictions.detections"), 3)
+        self.assertListEqual(
+            dataset.values("predictions.detections.eval"),
+            [None, None, ["fp"], ["tp"], [None]],
+        )
+        self.assertListEqual(
+            dataset.values("eval_tp"), [None, None, 0, 1, None]
+        )
+
+        # Evaluation without an `eval_key` does not modify the dataset
+        results = dataset.evaluate_detections(
+            "predictions", gt_field="ground_truth", num_workers=2
+        )
+        self.assertEqual(len(results.ytrue), 5)
+
     @drop_datasets
     def test_evaluate_instances_coco(self):
         dataset = self._make_instances_dataset()
@@ -1497,6 +1586,81 @@ class DetectionsTests(unittest.TestCase):
             detection["eval2"]
 
 
+class BoxIoUTests(unittest.TestCase):
+    def _make_detections(self, num_objects):
+        detections = []
+        for _ in range(num_objects):
+            x, y = np.random.rand(2) * 0.8
+            w, h = np.random.rand(2) * 0.3
+            detections.append(
+                fo.Detection(
+                    label=random.choice(["cat", "dog"]),
+                    bounding_box=[x, y, w, h],
+                    iscrowd=random.random() < 0.2,
+                )
+            )
+
+        return detections
+
+    def _compute_ious_loop(self, preds, gts, iscrowd=None, classwise=False):
+        is_symmetric = preds is gts
+
+        ious = np.zeros((len(preds), len(gts)))
+        for j, gt in enumerate(gts):
+            gt_crowd = iscrowd(gt) if iscrowd is not None else False
+            for i, pred in enumerate(preds):
+                if is_symmetric and i < j:
+                    iou = ious[j, i]
+                elif is_symmetric and i == j:
+                    iou = 1
+                elif classwise and pred.label != gt.label:
+                    continue
+                else:
+                    iou = foui._compute_bbox_iou(gt, pred, gt_crowd=gt_crowd)
+
+                ious[i, j] = iou
+
+        return ious
+
+    def test_compute_bbox_ious(self):
+        iscrowd = lambda l: bool(l.get_attribute_value("iscrowd", False))
+
+        preds = self._make_detections(25)
+        gts = self._make_detections(15)
+
+        for classwise in (False, True):
+            for _iscrowd in (None, iscrowd):
+                for _preds, _gts in ((preds, gts), (preds, preds)):
+                    expected = self._compute_ious_loop(
+                        _preds, _gts, iscrowd=_iscrowd, classwise=classwise
+                    )
+                    actual = foui.compute_ious(
+                        _preds, _gts, iscrowd=_iscrowd, classwise=classwise
+                    )
+
+                    self.assertEqual(actual.shape, expected.shape)
+                    self.assertTrue(np.array_equal(actual, expected))
+
+    def test_compute_bbox_ious_edge_cases(self):
+        # Crowd: union is the area of the predicted object
+        pred = fo.Detection(bounding_box=[0.1, 0.1, 0.2, 0.2])
+        gt = fo.Detection(bounding_box=[0.0, 0.0, 0.5, 0.5], iscrowd=True)
+
+        iscrowd = lambda l: bool(l.get_attribute_value("iscrowd", False))
+        ious = foui.compute_ious([pred], [gt], iscrowd=iscrowd)
+        self.assertAlmostEqual(ious[0, 0], 1.0)
+
+        # Degenerate boxes have zero IoU rather than NaN
+        empty = fo.Detection(bounding_box=[0.2, 0.2, 0.0, 0.0])
+        ious = foui.compute_ious([empty], [empty.copy()])
+        self.assertEqual(ious[0, 0], 0.0)
+
+        # Self-IoU is always one, even with `classwise=True`
+        dets = self._make_detections(5)
+        ious = foui.compute_ious(dets, dets, classwise=True)
+        self.assertTrue(np.array_equal(np.diag(ious), np.ones(5)))
+
+
 class CuboidTests(unittest.TestCase):
     def _make_dataset(self):
         group = fo.Group()
@@ -5,11 +5,16 @@ FiftyOne server-related unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import asyncio
 import unittest
 
 import fiftyone.core.dataset as fod
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
+import fiftyone.core.metadata as fom
+import fiftyone.core.sample as fos
+import fiftyone.core.stages as fosg
+import fiftyone.server.samples as foss
 import fiftyone.server.view as fosv
 
 from decorators import drop_datasets
@@ -901,3 +906,108 @@ class ServerViewTests(unittest.TestCase):
         ]
 
         self.assertEqual(expected, returned)
+
+
+# The async database client is bound to the event loop that first uses it
+_LOOP = asyncio.new_event_loop()
+
+
+def _run(coro):
+    return _LOOP.run_until_complete(coro)
+
+
+class ServerSamplesTests(unittest.TestCase):
+    def _make_dataset(self):
+        dataset = fod.Dataset()
+        dataset.add_samples(
+            [
+                fos.Sample(
+                    filepath="image%d.png" % i,
+                    metadata=fom.ImageMetadata(width=10, height=10),
+                    value=[None, 2.0, 1.0, 2.5, 1.0][i % 5],
+                )
+                for i in range(23)
+            ]
+        )
+        return dataset
+
+    def _paginate(self, dataset, stages, first=5, keyset=True):
+        ids = []
+        after = None
+        offset = -1
+        while True:
+            results = _run(
+                foss.paginate_samples(
+                    dataset.name, stages, None, first, after=after
+                )
+            )
+            ids.extend(str(e.node.id) for e in results.edges)
+            if not results.page_info.has_next_page:
+                return ids
+
+            if keyset:
+                after = results.edges[-1].cursor
+            else:
+                offset += first
+                after = offset
+
+    @drop_datasets
+    def test_paginate_samples(self):
+        dataset = self._make_dataset()
+
+        view = dataset.match_tags("test", bool=False)
+        stages = view._serialize()
+        expected = [str(_id) for _id in view.values("_id")]
+
+        self.assertListEqual(self._paginate(dataset, stages), expected)
+        self.assertListEqual(
+            self._paginate(dataset, stages, keyset=False), expected
+        )
+
+        results = _run(
+            foss.paginate_samples(dataset.name, stages, None, 5)
+        )
+        self.assertEqual(foss._parse_cursor(results.edges[2].cursor)[0], 2)
+
+    @drop_datasets
+    def test_paginate_sorted_samples(self):
+        dataset = self._make_dataset()
+
+        for reverse in (False, True):
+            view = dataset.sort_by("value", reverse=reverse).exists("filepath")
+            stages = view._serialize()
+
+            expected = [
+                str(_id)
+                for _, _id in sorted(
+                    zip(
+                        map(_sort_value, dataset.values("value")),
+                        dataset.values("_id"),
+                    ),
+                    key=lambda x: (-x[0] if reverse else x[0], str(x[1])),
+                )
+            ]
+            self.assertListEqual(self._paginate(dataset, stages), expected)
+
+            keyset = foss._get_keyset(view)
+            self.assertEqual(keyset, (0, "value", -1 if reverse else 1))
+
+    @drop_datasets
+    def test_paginate_samples_offset_fallback(self):
+        dataset = self._make_dataset()
+
+        view = dataset.sort_by("value").limit(12)
+        self.assertIsNone(foss._get_keyset(view))
+        self.assertIsNone(foss._get_keyset(dataset.shuffle(seed=51)))
+
+        stages = view._serialize()
+        expected = [str(_id) for _id in view.values("_id")]
+        self.assertListEqual(self._paginate(dataset, stages), expected)
+
+        stage = fosg.Select(dataset.values("id")[::-1], ordered=True)
+        self.assertIsNone(foss._get_keyset(dataset.add_stage(stage)))
+
+
+def _sort_value(value):
+    # MongoDB sorts None before numbers
+    return float("-inf") if value is None else value